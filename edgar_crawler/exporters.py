@@ -0,0 +1,27 @@
+# Define your item exporters here
+#
+# Don't forget to register your exporter in the FEED_EXPORTERS setting
+# See: https://docs.scrapy.org/en/latest/topics/exporters.html
+
+from io import BytesIO
+from typing import Any
+
+import orjson
+from scrapy.exporters import BaseItemExporter
+
+# Scrapy 2.18 renamed BaseItemExporter._get_serialized_fields to get_serialized_fields
+_get_serialized_fields = getattr(BaseItemExporter, "get_serialized_fields", None) or getattr(
+    BaseItemExporter, "_get_serialized_fields"
+)
+
+
+class OrjsonLinesExporter(BaseItemExporter):
+    """A drop-in replacement for JsonLinesItemExporter that serializes items with orjson (always UTF-8)."""
+
+    def __init__(self, file: BytesIO, **kwargs: Any):
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+
+    def export_item(self, item: Any) -> None:
+        itemdict = dict(_get_serialized_fields(self, item))
+        self.file.write(orjson.dumps(itemdict, option=orjson.OPT_APPEND_NEWLINE))
@@ -3,22 +3,23 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
 
-import scrapy
+from dataclasses import dataclass
 
 
-class ExhibitItem(scrapy.Item):
-    index_html_url = scrapy.Field()
-    index_text_url = scrapy.Field()
-    cik = scrapy.Field()
-    name = scrapy.Field()
-    type = scrapy.Field()
-    filing_date = scrapy.Field()
-    report_date = scrapy.Field()
-    seq = scrapy.Field()
-    desc = scrapy.Field()
-    doc_type = scrapy.Field()
-    size = scrapy.Field()
-    filename = scrapy.Field()
-    file_url = scrapy.Field()
-    file = scrapy.Field()
-    filing_metadata = scrapy.Field()
+@dataclass(slots=True)
+class ExhibitItem:
+    index_html_url: str
+    index_text_url: str
+    cik: str
+    name: str
+    type: str
+    filing_date: str
+    report_date: str
+    seq: str | None
+    desc: str | None
+    doc_type: str
+    size: str | None
+    filename: str | None
+    file_url: str | None
+    file: str | None
+    filing_metadata: str
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from itemadapter import ItemAdapter
+from scrapy import Request
 from scrapy.pipelines.files import FilesPipeline
 from scrapy.pipelines.media import FileInfoOrError, MediaPipeline
 
@@ -28,6 +29,12 @@ gcp_auth()
 
 
 class WebPagePipeline(FilesPipeline):
+    def get_media_requests(self, item: Any, info: MediaPipeline.SpiderInfo) -> list[Request]:
+        requests = super().get_media_requests(item, info)
+        for request in requests:
+            request.meta["dont_cache"] = True
+        return requests
+
     def item_completed(self, results: list[FileInfoOrError], item: Any, info: MediaPipeline.SpiderInfo):
         file_paths = [x["path"] for ok, x in results if ok]  # pyright: ignore[reportIndexIssue]
         adapter = ItemAdapter(item)
@@ -91,6 +91,9 @@ AUTOTHROTTLE_TARGET_CONCURRENCY = 5.0
 # REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
+FEED_EXPORTERS = {
+    "jsonlines": "edgar_crawler.exporters.OrjsonLinesExporter",
+}
 
 FILES_STORE = "gs://YOUR-BUCKET/files/"
 GCS_PROJECT_ID = "YOUR-PROJECT-ID"
@@ -1,14 +1,26 @@
+import io
 import itertools
-import json
 import math
-import tempfile
 import zipfile
 from datetime import datetime
 from typing import AsyncGenerator, Generator
 
+import orjson
 import scrapy
+from lxml.etree import XPath
 from scrapy.http import Response
 
+# Pre-compiled XPath expressions, evaluated directly on the lxml tree of each filing index page
+_TABLES = XPath('//table[@class="tableFile" and @summary="Document Format Files"]')
+# Only rows whose type cell starts with EX-10 (case-insensitive) reach Python
+_EXHIBIT_ROWS = XPath(
+    ".//tr[position()>1][count(td)=5]"
+    '[starts-with(translate(td[4], "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"), "EX-10")]'
+)
+_FORMS = XPath('//div[@class="formDiv"]')
+_GROUPS = XPath('.//div[@class="formGrouping"]')
+_INFO_DIVS = XPath('.//*[contains(@class, "info")]')
+
 
 class ExhibitSpider(scrapy.Spider):
     name = "exhibit"
@@ -23,71 +35,86 @@ class ExhibitSpider(scrapy.Spider):
                 "overwrite": True,
             },
         },
+        # Let AutoThrottle converge on SEC's latency; the download delay keeps us under 10 req/s per domain
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 8.0,
+        "AUTOTHROTTLE_MAX_DELAY": 10.0,
+        "CONCURRENT_REQUESTS": 32,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 16,
+        "DOWNLOAD_DELAY": 0.125,
+        # Filing index pages are immutable once filed, so retries and reruns can be served locally;
+        # exhibits are kept out of the cache by WebPagePipeline since they already live in FILES_STORE
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_IGNORE_HTTP_CODES": [403, 429, 500, 502, 503, 504],
     }
 
     async def start(self) -> AsyncGenerator[scrapy.Request, None]:
         """Start the spider by generating requests for each quarter's master index file within the specified year range."""
         quarters = [1, 2, 3, 4]
-        curr_year = datetime.now().year
-        curr_quarter = math.ceil(datetime.now().month / 3)
+        now = datetime.now()
+        curr_year = now.year
+        curr_quarter = math.ceil(now.month / 3)
         # both start_year and end_year are passed from the command line arguments
         for year in range(int(self.start_year), int(self.end_year) + 1):  # pyright: ignore[reportAttributeAccessIssue]
             for quarter in quarters:
                 if year == curr_year and quarter > curr_quarter:
                     break
                 url = f"{self.index_url}/{year}/QTR{quarter}/master.zip"
-                yield scrapy.Request(url=url, callback=self.parse_index)
+                # the current quarter's index is still growing, so always fetch it fresh
+                dont_cache = year == curr_year and quarter == curr_quarter
+                yield scrapy.Request(url=url, callback=self.parse_index, meta={"dont_cache": dont_cache})
 
     def parse_index(self, response: Response):
         """Parse the master index file to extract all filing index pages."""
+        # cheap substring check on the raw bytes so most rows are skipped before decoding and splitting
+        type_markers = tuple(f"|{t}|".encode("latin-1") for t in self.filing_types)
         try:
-            with tempfile.TemporaryFile(mode="w+b") as tmp:
-                content = response.body
-                tmp.write(content)
-                with zipfile.ZipFile(tmp).open("master.idx") as f:
-                    for line in itertools.islice(f, 11, None):
-                        line = line.decode("latin-1").strip()
-                        cik, name, type, filing_date, index_text_url = line.split("|")
-                        if type not in self.filing_types:
-                            continue
-                        index_text_url = "https://www.sec.gov/Archives/" + index_text_url
-                        index_html_url = index_text_url.replace(".txt", "-index.html")
-                        yield scrapy.Request(
-                            url=index_html_url,
-                            callback=self.parse_index_html,
-                            meta={
-                                "cik": cik,
-                                "name": name,
-                                "type": type,
-                                "filing_date": filing_date,
-                                "index_text_url": index_text_url,
-                                "index_html_url": index_html_url,
-                            },
-                        )
+            with zipfile.ZipFile(io.BytesIO(response.body)).open("master.idx") as f:
+                for raw in itertools.islice(f, 11, None):
+                    if not any(marker in raw for marker in type_markers):
+                        continue
+                    cik, name, type, filing_date, index_text_url = raw.decode("latin-1").strip().split("|")
+                    if type not in self.filing_types:
+                        continue
+                    index_text_url = "https://www.sec.gov/Archives/" + index_text_url
+                    index_html_url = index_text_url.replace(".txt", "-index.html")
+                    yield scrapy.Request(
+                        url=index_html_url,
+                        callback=self.parse_index_html,
+                        meta={
+                            "cik": cik,
+                            "name": name,
+                            "type": type,
+                            "filing_date": filing_date,
+                            "index_text_url": index_text_url,
+                            "index_html_url": index_html_url,
+                        },
+                    )
         except Exception as e:
             self.logger.error(f"Error parsing index text URL {response.url}: {e}")
 
     def parse_index_html(self, response: Response) -> Generator[dict[str, str | None | list[str]], None, None]:
         """Extract all exhibit data from the table."""
-        tables = response.css("table.tableFile")
+        tables = _TABLES(response.selector.root)  # pyright: ignore[reportAttributeAccessIssue]
         if len(tables) == 0:
             return
         metadata: dict[str, str] | None = self.parse_metadata(response)
         if metadata is None:
             return
+        # identical for every exhibit of the filing, so serialize it once
+        filing_metadata = orjson.dumps(metadata).decode()
 
         for table in tables:
-            if table.attrib["summary"] != "Document Format Files":
-                continue
-            for tr in table.css("tr")[1:]:
-                seq, desc, doc_link, doc_type, size = tr.css("td")
-                doc_type = doc_type.css("*::text").get("").upper()
+            for tr in _EXHIBIT_ROWS(table):
+                cells = tr.findall("td")
+                # first text node of each cell, which may sit inside a child element
+                seq, desc, _, doc_type, size = (next(td.itertext(), None) for td in cells)
+                doc_type = (doc_type or "").upper()
                 if doc_type != "EX-10" and not doc_type.startswith("EX-10."):
                     continue
-                link = doc_link.css("a").attrib["href"]
-                if link is None:
+                link = cells[2].find("a")
+                if link is None or (href := link.get("href")) is None:
                     continue
-                filename = doc_link.css("a::text").get()
                 yield {
                     "index_html_url": response.meta["index_html_url"],
                     "index_text_url": response.meta["index_text_url"],
@@ -96,38 +123,38 @@ class ExhibitSpider(scrapy.Spider):
                     "type": response.meta["type"],
                     "filing_date": response.meta["filing_date"],
                     "report_date": metadata["Period of Report"],
-                    "seq": seq.css("*::text").get(),
-                    "desc": desc.css("*::text").get(),
+                    "seq": seq,
+                    "desc": desc,
                     "doc_type": doc_type,
-                    "size": size.css("*::text").get(),
-                    "filename": filename,
-                    "file_urls": [self.base_url + link],
-                    "filing_metadata": json.dumps(metadata),
+                    "size": size,
+                    "filename": next(link.itertext(), None),
+                    "file_urls": [self.base_url + href],
+                    "filing_metadata": filing_metadata,
                 }
 
     def parse_metadata(self, response: Response) -> dict[str, str] | None:
         """Extract filing metadata from the content above the table."""
-        forms = response.css("div.formDiv")
+        forms = _FORMS(response.selector.root)  # pyright: ignore[reportAttributeAccessIssue]
         if not forms:
             return None
 
-        groups = forms[0].css("div.formGrouping")
+        groups = _GROUPS(forms[0])
         if not groups:
             return None
 
         metadata = {}
 
         for group in groups:
-            divs = group.css("[class*='info']")
             curr_header = None
 
-            for div in divs:
-                if 'class="infoHead"' in str(div):
+            for div in _INFO_DIVS(group):
+                cls = div.get("class", "")
+                if cls == "infoHead":
                     if curr_header is not None:
                         metadata[curr_header] = "na"
-                    curr_header = div.css("*::text").get("").strip() or None
-                elif 'class="info"' in str(div) and curr_header:
-                    metadata[curr_header] = div.css("*::text").get("na").strip()
+                    curr_header = next(div.itertext(), "").strip() or None
+                elif cls == "info" and curr_header:
+                    metadata[curr_header] = next(div.itertext(), "na").strip()
                     curr_header = None
 
             if curr_header is not None:
@@ -0,0 +1,66 @@
+import unittest
+from pathlib import Path
+
+from scrapy.http import HtmlResponse, Request
+
+from edgar_crawler.spiders.exhibit_spider import ExhibitSpider
+
+FIXTURES = Path(__file__).parent / "fixtures"
+INDEX_HTML_URL = "https://www.sec.gov/Archives/edgar/data/1/0000000001-23-000001-index.html"
+META = {
+    "cik": "1",
+    "name": "EXAMPLE CORP",
+    "type": "10-K",
+    "filing_date": "2023-02-01",
+    "index_text_url": "https://www.sec.gov/Archives/edgar/data/1/0000000001-23-000001.txt",
+    "index_html_url": INDEX_HTML_URL,
+}
+
+
+def index_response() -> HtmlResponse:
+    return HtmlResponse(
+        url=INDEX_HTML_URL,
+        body=(FIXTURES / "exhibit_index.html").read_bytes(),
+        encoding="utf-8",
+        request=Request(INDEX_HTML_URL, meta=META),
+    )
+
+
+class ParseIndexHtmlTest(unittest.TestCase):
+    def setUp(self):
+        self.spider = ExhibitSpider(start_year=2023, end_year=2023)
+        self.items = list(self.spider.parse_index_html(index_response()))
+
+    def test_metadata(self):
+        self.assertEqual(
+            self.spider.parse_metadata(index_response()),
+            {"Filing Date": "2023-02-01", "Period of Report": "2022-12-31"},
+        )
+
+    def test_only_linked_ex10_rows_from_document_table(self):
+        self.assertEqual([item["seq"] for item in self.items], ["2", "3", "4"])
+
+    def test_plain_row(self):
+        item = self.items[0]
+        self.assertEqual(item["desc"], "EXHIBIT 10.1")
+        self.assertEqual(item["doc_type"], "EX-10.1")
+        self.assertEqual(item["size"], "2000")
+        self.assertEqual(item["filename"], "ex101.htm")
+        self.assertEqual(item["file_urls"], ["https://www.sec.gov/Archives/edgar/data/1/ex101.htm"])
+        self.assertEqual(item["report_date"], "2022-12-31")
+
+    def test_text_inside_child_elements(self):
+        item = self.items[1]
+        self.assertEqual(item["desc"], "bold desc")
+        self.assertEqual(item["doc_type"], "EX-10.5")
+
+    def test_empty_cell_and_lowercase_type(self):
+        item = self.items[2]
+        self.assertIsNone(item["desc"])
+        self.assertEqual(item["doc_type"], "EX-10")
+        self.assertEqual(item["filename"], "ex10.htm")
+        self.assertEqual(item["file_urls"], ["https://www.sec.gov/ix?doc=/Archives/edgar/data/1/ex10.htm"])
+
+
+if __name__ == "__main__":
+    unittest.main()